@@ -69,6 +69,31 @@ MODALITIES = {
     "T2w": EstimatorType.ANAT,
 }
 
+# Precomputed suffix categories, so membership tests are single hash lookups
+_FMAP_SUFFIXES = frozenset(("fieldmap", "phasediff", "phase1", "phase2"))
+_PHASE_SUFFIXES = frozenset(("phase1", "phase2"))
+_PEPOLAR_SUFFIXES = frozenset(("bold", "dwi", "epi", "sbref", "asl", "m0scan"))
+_ANAT_SUFFIXES = frozenset(("T1w", "T2w"))
+
+
+_wf_factories = {}
+"""Memoized workflow factories, keyed by :class:`EstimatorType`."""
+
+
+def _get_wf_factory(method):
+    """Resolve the workflow factory for ``method``, importing it only on first use."""
+    if method not in _wf_factories:
+        if method in (EstimatorType.MAPPED, EstimatorType.PHASEDIFF):
+            from .workflows.fit.fieldmap import init_fmap_wf as factory
+        elif method == EstimatorType.PEPOLAR:
+            from .workflows.fit.pepolar import init_topup_wf as factory
+        elif method == EstimatorType.ANAT:
+            from .workflows.fit.syn import init_syn_sdc_wf as factory
+        else:
+            raise ValueError(f"Invalid estimation method type {method}.")
+        _wf_factories[method] = factory
+    return _wf_factories[method]
+
 
 def _type_setter(obj, attribute, value):
     """Make sure the type of estimation is not changed."""
@@ -210,7 +235,7 @@ class FieldmapFile:
             raise ValueError(f"File path <{value}> does not look like a NIfTI file.")
 
         suffix = re.search(r"(?<=_)\w+(?=\.nii)", value.name).group()
-        if suffix not in tuple(MODALITIES.keys()):
+        if suffix not in MODALITIES:
             raise ValueError(
                 f"File path <{value}> with suffix <{suffix}> is not a valid "
                 "fieldmap sourcefile."
@@ -239,11 +264,11 @@ class FieldmapFile:
             else None
         )
 
-        if self.suffix in ("T1w", "T2w"):
+        if self.suffix in _ANAT_SUFFIXES:
             self.metadata["TotalReadoutTime"] = 0.0
 
         # Check for REQUIRED metadata (depends on suffix.)
-        if self.suffix in ("bold", "dwi", "epi", "sbref", "asl", "m0scan"):
+        if self.suffix in _PEPOLAR_SUFFIXES:
             if "PhaseEncodingDirection" not in self.metadata:
                 raise MetadataError(
                     f"Missing 'PhaseEncodingDirection' for <{self.path}>."
@@ -268,7 +293,7 @@ class FieldmapFile:
                 f"Missing 'EchoTime1' and/or 'EchoTime2' for <{self.path}>."
             )
 
-        elif self.suffix in ("phase1", "phase2") and ("EchoTime" not in self.metadata):
+        elif self.suffix in _PHASE_SUFFIXES and ("EchoTime" not in self.metadata):
             raise MetadataError(f"Missing 'EchoTime' for <{self.path}>.")
 
 
@@ -312,17 +337,15 @@ class FieldmapEstimation:
         suffix_set = set(suffix_list)
 
         # Fieldmap option 1: actual field-mapping sequences
-        fmap_types = suffix_set.intersection(
-            ("fieldmap", "phasediff", "phase1", "phase2")
-        )
-        if len(fmap_types) > 1 and fmap_types - set(("phase1", "phase2")):
+        fmap_types = suffix_set.intersection(_FMAP_SUFFIXES)
+        if len(fmap_types) > 1 and fmap_types - _PHASE_SUFFIXES:
             raise TypeError(f"Incompatible suffices found: <{','.join(fmap_types)}>.")
 
         if fmap_types:
             sources = sorted(
                 f.path
                 for f in self.sources
-                if f.suffix in ("fieldmap", "phasediff", "phase1", "phase2")
+                if f.suffix in _FMAP_SUFFIXES
             )
 
             # Automagically add the corresponding phase2 file if missing as argument
@@ -375,12 +398,10 @@ class FieldmapEstimation:
 
         # Fieldmap option 2: PEPOLAR (and fieldmap-less or ANAT)
         # IMPORTANT NOTE: fieldmap-less approaches can be considered PEPOLAR with RO = 0.0s
-        pepolar_types = suffix_set.intersection(("bold", "dwi", "epi", "sbref", "asl", "m0scan"))
-        anat_types = suffix_set.intersection(("T1w", "T2w"))
+        pepolar_types = suffix_set.intersection(_PEPOLAR_SUFFIXES)
+        anat_types = suffix_set.intersection(_ANAT_SUFFIXES)
         _pepolar_estimation = (
-            len(
-                [f for f in suffix_list if f in ("bold", "dwi", "epi", "sbref", "asl", "m0scan")]
-            ) > 1
+            sum(f in _PEPOLAR_SUFFIXES for f in suffix_list) > 1
         )
 
         if _pepolar_estimation and not anat_types:
@@ -456,24 +477,23 @@ class FieldmapEstimation:
         kwargs["name"] = f"wf_{self.sanitized_id}"
 
         if self.method in (EstimatorType.MAPPED, EstimatorType.PHASEDIFF):
-            from .workflows.fit.fieldmap import init_fmap_wf
-
-            kwargs["mode"] = str(self.method).rpartition(".")[-1].lower()
-            self._wf = init_fmap_wf(**kwargs)
+            kwargs["mode"] = self.method.name.lower()
+            self._wf = _get_wf_factory(self.method)(**kwargs)
             if set_inputs:
+                # Sort only the (at most three) magnitude files, so that
+                # magnitude1 deterministically precedes magnitude2
+                mag_files = [f for f in self.sources if f.suffix.startswith("magnitude")]
+                mag_files.sort(key=lambda f: f.suffix)
                 self._wf.inputs.inputnode.magnitude = [
-                    str(f.path.absolute())
-                    for f in self.sources if f.suffix.startswith("magnitude")
+                    str(f.path.absolute()) for f in mag_files
                 ]
                 self._wf.inputs.inputnode.fieldmap = [
                     (str(f.path.absolute()), f.metadata)
                     for f in self.sources
-                    if f.suffix in ("fieldmap", "phasediff", "phase2", "phase1")
+                    if f.suffix in _FMAP_SUFFIXES
                 ]
         elif self.method == EstimatorType.PEPOLAR:
-            from .workflows.fit.pepolar import init_topup_wf
-
-            self._wf = init_topup_wf(**kwargs)
+            self._wf = _get_wf_factory(self.method)(**kwargs)
 
             if set_inputs:
                 self._wf.inputs.inputnode.in_data = [
@@ -483,9 +503,7 @@ class FieldmapEstimation:
                     f.metadata for f in self.sources
                 ]
         elif self.method == EstimatorType.ANAT:
-            from .workflows.fit.syn import init_syn_sdc_wf
-
-            self._wf = init_syn_sdc_wf(**kwargs)
+            self._wf = _get_wf_factory(self.method)(**kwargs)
 
         return self._wf
 
@@ -596,9 +596,11 @@ def find_anatomical_estimators(
             meta.update({"TotalReadoutTime": trt})
             epi_targets.append(fm.FieldmapFile(candidate, metadata=meta))
 
+        preference = {s: i for i, s in enumerate(suffixes)}
+
         def sort_key(fmap):
             # Return sbref before DWI/BOLD and shortest echo first
-            return suffixes.index(fmap.suffix), fmap.metadata.get("EchoTime", 1)
+            return preference[fmap.suffix], fmap.metadata.get("EchoTime", 1)
 
         for target in sorted(epi_targets, key=sort_key):
             if target.path in hits:
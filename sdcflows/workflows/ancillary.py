@@ -29,12 +29,15 @@ from niworkflows.engine.workflows import LiterateWorkflow as Workflow
 LOGGER = logging.getLogger("nipype.workflow")
 
 
-def init_brainextraction_wf(name="brainextraction_wf"):
+def init_brainextraction_wf(omp_nthreads=1, name="brainextraction_wf"):
     """
     Remove nonbrain tissue from images.
 
     Parameters
     ----------
+    omp_nthreads : :obj:`int`, optional
+        Maximum number of threads N4 may use (the only multithreaded process
+        in this workflow)
     name : :obj:`str`, optional
         Workflow name (default: ``"brainextraction_wf"``)
 
@@ -88,8 +91,9 @@ def init_brainextraction_wf(name="brainextraction_wf"):
             n_iterations=[50] * 5,
             convergence_threshold=1e-7,
             shrink_factor=4,
+            num_threads=omp_nthreads,
         ),
-        n_procs=8,
+        n_procs=omp_nthreads,
         name="n4",
     )
     clipper_post = pe.Node(IntensityClip(p_min=0.01, p_max=99.9), name="clipper_post")
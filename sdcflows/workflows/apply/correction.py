@@ -131,7 +131,7 @@ def init_unwarp_wf(*, free_mem=None, omp_nthreads=1, debug=False, name="unwarp_w
     merge = pe.Node(MergeSeries(), name="merge")
     average = pe.Node(RobustAverage(mc_method=None), name="average")
 
-    brainextraction_wf = init_brainextraction_wf()
+    brainextraction_wf = init_brainextraction_wf(omp_nthreads=omp_nthreads)
 
     # fmt:off
     workflow.connect([
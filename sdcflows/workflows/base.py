@@ -43,6 +43,10 @@ def init_fmap_preproc_wf(
     """
     Create and combine estimator workflows.
 
+    If no estimators are passed in, a lightweight workflow exposing only the
+    (disconnected) ``outputnode`` is returned, so that node construction and
+    the imports of the estimation workflows are skipped altogether.
+
     Parameters
     ----------
     estimators : :obj:`list` of :py:class:`~sdcflows.fieldmaps.FieldmapEstimator`
@@ -75,6 +79,23 @@ def init_fmap_preproc_wf(
         The preprocessed fieldmap coefficients.
 
     """
+    workflow = Workflow(name=name)
+
+    out_fields = ("fmap", "fmap_coeff", "fmap_ref", "fmap_mask", "fmap_id", "method")
+
+    if not estimators:
+        # Nothing to estimate (e.g., subject without fieldmaps): skip building
+        # the merge machinery and importing the estimation workflows
+        workflow.add_nodes([
+            pe.Node(
+                niu.IdentityInterface(fields=out_fields),
+                name="outputnode",
+                run_without_submitting=True,
+                mem_gb=DEFAULT_MEMORY_MIN_GB,
+            )
+        ])
+        return workflow
+
     from sdcflows.workflows.fit.pepolar import INPUT_FIELDS as _pepolar_fields
     from sdcflows.workflows.fit.syn import INPUT_FIELDS as _syn_fields
     from sdcflows.workflows.outputs import init_fmap_derivatives_wf, init_fmap_reports_wf
@@ -85,38 +106,51 @@ def init_fmap_preproc_wf(
         EstimatorType.PEPOLAR: _pepolar_fields,
     }
 
-    workflow = Workflow(name=name)
-
-    out_fields = ("fmap", "fmap_coeff", "fmap_ref", "fmap_mask", "fmap_id", "method")
     out_merge = {
-        f: pe.Node(niu.Merge(len(estimators)), name=f"out_merge_{f}")
+        f: pe.Node(
+            niu.Merge(len(estimators)),
+            name=f"out_merge_{f}",
+            run_without_submitting=True,
+            mem_gb=DEFAULT_MEMORY_MIN_GB,
+        )
         for f in out_fields
     }
     # Fieldmaps and coefficient files can come in pairs, ensure they are not flattened
     out_merge["fmap"].inputs.no_flatten = True
     out_merge["fmap_coeff"].inputs.no_flatten = True
 
-    outputnode = pe.Node(niu.IdentityInterface(fields=out_fields), name="outputnode")
-
-    workflow.connect(
-        [
-            (mergenode, outputnode, [("out", field)])
-            for field, mergenode in out_merge.items()
-        ]
+    outputnode = pe.Node(
+        niu.IdentityInterface(fields=out_fields),
+        name="outputnode",
+        run_without_submitting=True,
+        mem_gb=DEFAULT_MEMORY_MIN_GB,
     )
 
+    # Accumulate all edges and commit them to the workflow graph in one go
+    connections = [
+        (mergenode, outputnode, [("out", field)])
+        for field, mergenode in out_merge.items()
+    ]
+
     for n, estimator in enumerate(estimators, 1):
         est_wf = estimator.get_workflow(
             omp_nthreads=omp_nthreads,
             debug=debug,
             sloppy=sloppy,
         )
-        source_files = [
-            str(f.path) for f in estimator.sources if f.suffix not in ("T1w", "T2w")
-        ]
+        # Collect source files and metadata in a single scan of the sources
+        source_files = []
+        fmap_meta = []
+        for f in estimator.sources:
+            fmap_meta.append(f.metadata)
+            if f.suffix not in ("T1w", "T2w"):
+                source_files.append(str(f.path))
 
         out_map = pe.Node(
-            niu.IdentityInterface(fields=out_fields), name=f"out_{estimator.bids_id}"
+            niu.IdentityInterface(fields=out_fields),
+            name=f"out_{estimator.bids_id}",
+            run_without_submitting=True,
+            mem_gb=DEFAULT_MEMORY_MIN_GB,
         )
         out_map.inputs.fmap_id = estimator.bids_id
 
@@ -127,13 +161,11 @@ def init_fmap_preproc_wf(
             name=f"fmap_derivatives_wf_{estimator.sanitized_id}",
         )
         fmap_derivatives_wf.inputs.inputnode.source_files = source_files
-        fmap_derivatives_wf.inputs.inputnode.fmap_meta = [
-            f.metadata for f in estimator.sources
-        ]
+        fmap_derivatives_wf.inputs.inputnode.fmap_meta = fmap_meta
 
         fmap_reports_wf = init_fmap_reports_wf(
             output_dir=str(output_dir),
-            fmap_type=str(estimator.method).rpartition(".")[-1].lower(),
+            fmap_type=estimator.method.name.lower(),
             bids_fmap_id=estimator.bids_id,
             name=f"fmap_reports_wf_{estimator.sanitized_id}",
         )
@@ -144,15 +176,15 @@ def init_fmap_preproc_wf(
             inputnode = pe.Node(
                 niu.IdentityInterface(fields=fields),
                 name=f"in_{estimator.sanitized_id}",
+                run_without_submitting=True,
+                mem_gb=DEFAULT_MEMORY_MIN_GB,
             )
-            # fmt:off
-            workflow.connect([
+            connections.append(
                 (inputnode, est_wf, [(f, f"inputnode.{f}") for f in fields])
-            ])
-            # fmt:on
+            )
 
         # fmt:off
-        workflow.connect([
+        connections += [
             (est_wf, fmap_derivatives_wf, [
                 ("outputnode.fmap", "inputnode.fieldmap"),
                 ("outputnode.fmap_ref", "inputnode.fmap_ref"),
@@ -170,10 +202,14 @@ def init_fmap_preproc_wf(
                 ("outputnode.fmap_mask", "fmap_mask"),
                 ("outputnode.method", "method")
             ]),
-        ])
+        ]
         # fmt:on
 
-        for field, mergenode in out_merge.items():
-            workflow.connect(out_map, field, mergenode, f"in{n}")
+        connections += [
+            (out_map, mergenode, [(field, f"in{n}")])
+            for field, mergenode in out_merge.items()
+        ]
+
+    workflow.connect(connections)
 
     return workflow
@@ -64,13 +64,15 @@ def init_sdcflows_wf():
                 name=f"fmap_derivatives_{estim.sanitized_id}",
             )
 
-            source_paths = [
-                str(source.path.absolute()) for source in estim.sources
-            ]
+            # Collect source files and metadata in a single scan of the sources
+            source_paths = []
+            fmap_meta = []
+            for source in estim.sources:
+                source_paths.append(str(source.path.absolute()))
+                fmap_meta.append(source.metadata)
+
             derivs_wf.inputs.inputnode.source_files = source_paths
-            derivs_wf.inputs.inputnode.fmap_meta = [
-                source.metadata for source in estim.sources
-            ]
+            derivs_wf.inputs.inputnode.fmap_meta = fmap_meta
 
             reportlets_wf = init_fmap_reports_wf(
                 fmap_type=estim.method,
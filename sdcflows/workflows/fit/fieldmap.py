@@ -236,7 +236,7 @@ def init_magnitude_wf(omp_nthreads, name="magnitude_wf"):
     # Merge input magnitude images
     # Do not reorient to RAS to preserve the validity of PhaseEncodingDirection
     magmrg = pe.Node(IntraModalMerge(hmc=False, to_ras=False), name="magmrg")
-    brainextraction_wf = init_brainextraction_wf()
+    brainextraction_wf = init_brainextraction_wf(omp_nthreads=omp_nthreads)
 
     # fmt: off
     workflow.connect([
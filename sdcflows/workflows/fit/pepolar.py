@@ -164,7 +164,7 @@ def init_topup_wf(
     ref_average = pe.Node(RobustAverage(num_threads=omp_nthreads), name="ref_average")
 
     # Sophisticated brain extraction of fMRIPrep
-    brainextraction_wf = init_brainextraction_wf()
+    brainextraction_wf = init_brainextraction_wf(omp_nthreads=omp_nthreads)
 
     # fmt: off
     workflow.connect([